@@ -1,12 +1,37 @@
 # src/layout_verifier/__init__.py
 #
 # Package init for layout-verifier.
+#
+# Public names are resolved lazily (PEP 562), so importing the package (or
+# running layout_verifier.cli) doesn't load pandas, PyMuPDF and openpyxl
+# until one of these is actually used.
+
+import importlib
+from typing import TYPE_CHECKING
 
-from .core import verify_layouts, verify_single_product, verify_and_color_excel
-from .excel_reader import load_product_data, get_product_by_item_number
-from .layout_reader import extract_text_from_layout, extract_text_from_ai, scan_layout_directory, extract_barcodes_from_layout
-from .verifier import verify_product_fields, VerificationSummary
-from .excel_colorizer import color_excel_cells, ColoringResult
+if TYPE_CHECKING:
+    from .core import verify_layouts, verify_single_product, verify_and_color_excel
+    from .excel_reader import load_product_data, get_product_by_item_number
+    from .layout_reader import extract_text_from_layout, extract_text_from_ai, scan_layout_directory, extract_barcodes_from_layout
+    from .verifier import verify_product_fields, VerificationSummary
+    from .excel_colorizer import color_excel_cells, ColoringResult
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "verify_layouts": "core",
+    "verify_single_product": "core",
+    "verify_and_color_excel": "core",
+    "load_product_data": "excel_reader",
+    "get_product_by_item_number": "excel_reader",
+    "extract_text_from_layout": "layout_reader",
+    "extract_text_from_ai": "layout_reader",
+    "scan_layout_directory": "layout_reader",
+    "extract_barcodes_from_layout": "layout_reader",
+    "verify_product_fields": "verifier",
+    "VerificationSummary": "verifier",
+    "color_excel_cells": "excel_colorizer",
+    "ColoringResult": "excel_colorizer",
+}
 
 __all__ = [
     # Main entry points
@@ -27,3 +52,19 @@ __all__ = [
     "verify_product_fields",
     "VerificationSummary",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,10 +3,11 @@
 # Command-line interface for the product layout verification tool.
 
 import argparse
+import os
 import sys
 import io
-from pathlib import Path
-from .core import verify_layouts, verify_single_product, verify_and_color_excel
+from functools import lru_cache
+from typing import Optional
 
 # Fix Windows console encoding for Unicode output
 if sys.platform == "win32":
@@ -14,7 +15,9 @@ if sys.platform == "win32":
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
 
-def parse_args() -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it for every parse_args call."""
     parser = argparse.ArgumentParser(
         description="Verify product information consistency between Excel master data and layout files (.ai or .pdf)."
     )
@@ -79,13 +82,39 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Specific Excel columns to verify. If not provided, uses default columns.",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=_positive_int,
+        default=None,
+        help="Number of processes used to extract layout text (default: one per CPU).",
+    )
+
+    return parser
 
-    return parser.parse_args()
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
 
 
 def main() -> None:
     args = parse_args()
 
+    # Imported after argument parsing so --help and usage errors don't pay
+    # for loading pandas, PyMuPDF and openpyxl.
+    from .core import verify_layouts, verify_single_product, verify_and_color_excel
+
     print("Product Layout Verification Tool")
     print("=" * 40)
     print(f"Excel file: {args.excel}")
@@ -97,9 +126,18 @@ def main() -> None:
         if args.layouts:
             layout_files = args.layouts
         elif args.layouts_dir:
-            # Collect files from directory
-            layouts_dir = Path(args.layouts_dir)
-            layout_files = [str(f) for f in layouts_dir.glob(f"*{args.ext}")]
+            # Collect files from directory (case-insensitive extension match,
+            # one scandir pass instead of globbing)
+            suffix = args.ext.lower()
+            try:
+                with os.scandir(args.layouts_dir) as entries:
+                    layout_files = sorted(
+                        entry.path
+                        for entry in entries
+                        if entry.name.lower().endswith(suffix) and entry.is_file()
+                    )
+            except OSError:
+                layout_files = []
 
         if not layout_files:
             print("No layout files specified or found.", file=sys.stderr)
@@ -115,6 +153,7 @@ def main() -> None:
                 excel_path=args.excel,
                 output_path=args.output,
                 columns=args.columns,
+                workers=args.workers,
             )
 
             # Print summary
@@ -153,6 +192,7 @@ def main() -> None:
                 output_format=args.format,
                 columns=args.columns,
                 extension=args.ext,
+                workers=args.workers,
             )
 
             # Print summary
@@ -6,6 +6,30 @@ import json
 import os
 from typing import Any, Dict, Optional
 
+# Use orjson when available: it parses straight from bytes, skipping the
+# text decoding layer. Falls back to the standard library otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _SafeNameTable(dict):
+    """
+    str.translate table for output filenames: alphanumerics are lowercased,
+    everything else becomes "_". Entries are filled in on first lookup, so
+    any Unicode input is handled the same as a per-character check would.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = char.lower() if char.isalnum() else "_"
+        self[codepoint] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
 
 def load_project_config(path: str) -> Dict[str, Any]:
     """
@@ -14,8 +38,12 @@ def load_project_config(path: str) -> Dict[str, Any]:
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if not isinstance(data, dict):
         raise ValueError("Config JSON must contain a single JSON object at the root.")
@@ -37,13 +65,10 @@ def decide_output_path(
         return explicit_out_path
 
     project_name = project_info.get("project_name", "unnamed_project")
-    safe_name = "".join(
-        c.lower() if c.isalnum() else "_" for c in project_name
-    )
+    safe_name = project_name.translate(_SAFE_NAME_TABLE)
     out_dir = "reports"
 
-    if not os.path.isdir(out_dir):
-        os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(out_dir, exist_ok=True)
 
     return os.path.join(out_dir, f"{safe_name}.md")
 
@@ -53,14 +78,23 @@ def save_markdown(output_text: str, out_path: str) -> None:
     Save the generated Markdown to disk, ensuring the directory exists.
     """
     directory = os.path.dirname(out_path)
-    if directory and not os.path.isdir(directory):
+    if directory:
         os.makedirs(directory, exist_ok=True)
 
+    # before writing, skip the first and last lines which are ```markdown and ```
+    # respectively; only the ends are inspected, the body is never split
+    text = output_text
+
+    first_end = text.find("\n")
+    first_line = text if first_end < 0 else text[:first_end]
+    if first_line.strip() == "```markdown":
+        text = "" if first_end < 0 else text[first_end + 1:]
+
+    # A single trailing newline does not start another line
+    text = text.removesuffix("\n")
+    last_start = text.rfind("\n") + 1
+    if text[last_start:].strip() == "```":
+        text = text[:max(last_start - 1, 0)]
+
     with open(out_path, "w", encoding="utf-8") as f:
-        # before writing, skip the first and last lines which are ```markdown and ``` respectively
-        lines = output_text.splitlines()
-        if lines and lines[0].strip() == "```markdown":
-            lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        f.write("\n".join(lines) + "\n")
\ No newline at end of file
+        f.write(text + "\n")
\ No newline at end of file
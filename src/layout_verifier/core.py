@@ -6,18 +6,164 @@
 # - For each layout: extract text, match to product, verify fields
 # - Generate verification report (or colored Excel output)
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
-
-from .excel_reader import load_product_data, get_product_by_item_number, get_verification_fields
-from .layout_reader import scan_layout_directory, extract_text_from_layout, extract_item_number_from_filename
-from .verifier import verify_product_fields, VerificationSummary, find_value_in_text, normalize_for_matching
+import os
+from typing import Generator, Optional
+
+from .excel_reader import load_product_data, get_verification_fields_for_item
+from .layout_reader import (
+    scan_layout_directory,
+    extract_text_from_layout,
+    extract_item_number_from_filename,
+    _get_mp_context,
+)
+from .verifier import (
+    verify_product_fields,
+    VerificationSummary,
+    find_value_in_text,
+    normalize_for_matching,
+    compact_for_matching,
+)
 from .excel_colorizer import color_excel_cells, ColoringResult
 from .report_writer import generate_report, save_report
 from .spinner import Spinner
 from .logging_utils import log_info, log_warning, log_error
 
 
+def _normalize_fields(
+    fields_by_item: dict[str, dict[str, str]],
+) -> dict[str, dict[str, str]]:
+    """Normalize every expected value once, rather than once per layout."""
+    return {
+        item: {name: normalize_for_matching(value) for name, value in fields.items()}
+        for item, fields in fields_by_item.items()
+    }
+
+
+# Upper bound for the default pool size; beyond this, extra processes mostly
+# add startup cost and memory rather than throughput
+MAX_DEFAULT_WORKERS = 32
+
+
+def _get_max_workers(job_count: int, workers: Optional[int] = None) -> int:
+    """
+    Number of worker processes for a batch: the requested count, or one per
+    CPU (capped at MAX_DEFAULT_WORKERS), and never more than one per job.
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+    return min(workers, max(1, job_count))
+
+
+def _get_chunksize(job_count: int, workers: int) -> int:
+    """Batch jobs per worker round-trip while leaving room to balance load."""
+    return max(1, job_count // (workers * 4))
+
+
+def _hint_willneed(path: Path) -> None:
+    """
+    Ask the kernel to start reading a file into the page cache.
+
+    posix_fadvise only queues readahead and returns immediately. It is not
+    available on Windows/macOS, where this does nothing.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _extract_one(layout_path: Path) -> tuple[str, str]:
+    """
+    Extract the text of a single layout file, usually in a worker process.
+
+    Only the extraction runs in workers; matching is cheap and stays on the
+    main process. Warnings logged during extraction (e.g. barcode decoding)
+    are written by the worker itself.
+
+    Args:
+        layout_path: Path to the layout file.
+
+    Returns:
+        ("ok", layout_text), or ("error", message) if the layout file could
+        not be read.
+    """
+    try:
+        return "ok", extract_text_from_layout(layout_path)
+    except (FileNotFoundError, ValueError) as e:
+        return "error", str(e)
+
+
+def _extract_layouts(
+    layout_paths: list[Path],
+    workers: Optional[int] = None,
+) -> Generator[tuple[str, str], None, None]:
+    """
+    Extract layout texts in a process pool, yielding outcomes in input order.
+
+    Layouts are independent, so the expensive PDF/AI parsing spreads across
+    processes while the caller consumes (and verifies) results as they come.
+    A path listed more than once is only extracted once.
+    """
+    if not layout_paths:
+        return
+
+    # Submit each distinct path once (in first-seen order), and remember how
+    # many more times each outcome is still needed
+    unique_paths = list(dict.fromkeys(layout_paths))
+    remaining: dict[Path, int] = {}
+    for layout_path in layout_paths:
+        remaining[layout_path] = remaining.get(layout_path, 0) + 1
+
+    workers = _get_max_workers(len(unique_paths), workers)
+    chunksize = _get_chunksize(len(unique_paths), workers)
+
+    # Keep the page cache a couple of batches ahead of the workers, so disk
+    # reads for upcoming layouts overlap with parsing the current ones
+    lookahead = workers * chunksize * 2
+    for layout_path in unique_paths[:lookahead]:
+        _hint_willneed(layout_path)
+
+    # A single worker runs in-process: no pool, and so no need for callers
+    # to guard their entry point with if __name__ == "__main__"
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=_get_mp_context())
+
+    with executor or nullcontext():
+        if executor is not None:
+            outcomes = executor.map(_extract_one, unique_paths, chunksize=chunksize)
+        else:
+            outcomes = map(_extract_one, unique_paths)
+        received: dict[Path, tuple[str, str]] = {}
+        received_count = 0
+        for layout_path in layout_paths:
+            # Unique paths arrive in first-seen order, so the outcome for this
+            # path is either already held or among the next ones
+            while layout_path not in received:
+                received[unique_paths[received_count]] = next(outcomes)
+                received_count += 1
+                if received_count + lookahead - 1 < len(unique_paths):
+                    _hint_willneed(unique_paths[received_count + lookahead - 1])
+
+            remaining[layout_path] -= 1
+            if remaining[layout_path]:
+                yield received[layout_path]
+            else:
+                yield received.pop(layout_path)
+
+
 def verify_layouts(
     excel_path: str,
     layouts_dir: str,
@@ -25,6 +171,7 @@ def verify_layouts(
     output_format: str = "markdown",
     columns: Optional[list[str]] = None,
     extension: str = ".ai",
+    workers: Optional[int] = None,
 ) -> VerificationSummary:
     """
     Verify product information consistency between Excel and layout files.
@@ -42,6 +189,11 @@ def verify_layouts(
         output_format: Report format - "markdown", "pdf", or "csv".
         columns: List of Excel columns to verify (optional, uses defaults if not provided).
         extension: File extension to scan for (default: ".ai").
+        workers: Number of processes for text extraction (default: one per CPU).
+                 With more than one, worker processes are started with
+                 forkserver/spawn, so scripts calling this must guard their
+                 entry point with if __name__ == "__main__". workers=1
+                 extracts in-process.
 
     Returns:
         VerificationSummary with all verification results.
@@ -63,49 +215,49 @@ def verify_layouts(
     # 3) Scan layouts directory and verify each
     log_info(f"Scanning layouts directory: {layouts_dir}")
 
-    spinner = Spinner("Verifying layouts...")
-    spinner.start()
+    layouts = list(scan_layout_directory(layouts_dir, extension=extension))
+    layouts_processed = len(layouts)
 
-    try:
-        layouts_processed = 0
-        for layout_path, item_number in scan_layout_directory(layouts_dir, extension=extension):
-            layouts_processed += 1
+    with Spinner(f"Verifying {layouts_processed} layouts..."):
+        # Resolve products up front, so layouts without an Excel row or with
+        # nothing to verify never reach the expensive text extraction.
+        fields_by_item: dict[str, Optional[dict[str, str]]] = {}
+        jobs: list[tuple[Path, str]] = []
 
-            # Get product data from Excel
-            product_data = get_product_by_item_number(products_df, item_number)
+        for layout_path, item_number in layouts:
+            if item_number not in fields_by_item:
+                fields_by_item[item_number] = get_verification_fields_for_item(products_df, item_number)
 
-            if product_data is None:
+            expected_fields = fields_by_item[item_number]
+            if expected_fields is None:
                 log_warning(f"No Excel entry for Item# '{item_number}' ({layout_path.name})")
                 summary.add_unmatched_layout(layout_path.name)
-                continue
-
-            # Extract fields to verify
-            expected_fields = get_verification_fields(product_data)
-
-            if not expected_fields:
+            elif not expected_fields:
                 log_warning(f"No fields to verify for Item# '{item_number}'")
+            else:
+                jobs.append((layout_path, item_number))
+
+        normalized_by_item = _normalize_fields(
+            {item: fields for item, fields in fields_by_item.items() if fields}
+        )
+
+        # Texts are extracted in worker processes and verified here, in the
+        # original order, as they arrive.
+        outcomes = _extract_layouts([layout_path for layout_path, _ in jobs], workers)
+        for (layout_path, item_number), (status, payload) in zip(jobs, outcomes, strict=True):
+            if status == "error":
+                log_error(f"Failed to read layout {layout_path.name}: {payload}")
                 continue
 
-            # Extract text from layout file
-            try:
-                layout_text = extract_text_from_layout(layout_path)
-            except (FileNotFoundError, ValueError) as e:
-                log_error(f"Failed to read layout {layout_path.name}: {e}")
-                continue
-
-            # Verify fields
             result = verify_product_fields(
                 item_number=item_number,
                 layout_file=layout_path.name,
-                expected_fields=expected_fields,
-                layout_text=layout_text,
+                expected_fields=fields_by_item[item_number],
+                layout_text=payload,
+                expected_normalized=normalized_by_item[item_number],
             )
-
             summary.add_result(result)
 
-    finally:
-        spinner.stop()
-
     log_info(f"Processed {layouts_processed} layout files.")
     log_info(
         f"Results: {summary.products_complete} complete, "
@@ -168,15 +320,12 @@ def verify_single_product(
         log_error(f"Failed to load Excel: {e}")
         return None
 
-    # Get product
-    product_data = get_product_by_item_number(products_df, item_number)
-    if product_data is None:
+    # Get fields to verify for the product
+    expected_fields = get_verification_fields_for_item(products_df, item_number)
+    if expected_fields is None:
         log_error(f"No Excel entry for Item# '{item_number}'")
         return None
 
-    # Get fields to verify
-    expected_fields = get_verification_fields(product_data)
-
     # Extract text from layout file
     try:
         layout_text = extract_text_from_layout(layout_path)
@@ -218,6 +367,7 @@ def verify_and_color_excel(
     excel_path: str | Path,
     output_path: Optional[str | Path] = None,
     columns: Optional[list[str]] = None,
+    workers: Optional[int] = None,
 ) -> ColoringResult:
     """
     Verify layouts against Excel data and color the Excel cells based on results.
@@ -229,6 +379,11 @@ def verify_and_color_excel(
         excel_path: Path to the Excel file with product master data.
         output_path: Where to save the colored Excel. If None, overwrites original.
         columns: List of Excel columns to verify (optional, uses defaults).
+        workers: Number of processes for text extraction (default: one per CPU).
+                 With more than one, worker processes are started with
+                 forkserver/spawn, so scripts calling this must guard their
+                 entry point with if __name__ == "__main__". workers=1
+                 extracts in-process.
 
     Returns:
         ColoringResult with summary of coloring operations.
@@ -256,10 +411,12 @@ def verify_and_color_excel(
     # Build verification results: {item_number: {field_name: matched}}
     verification_results: dict[str, dict[str, bool]] = {}
 
-    spinner = Spinner("Verifying layouts...")
-    spinner.start()
+    with Spinner("Verifying layouts..."):
+        # Resolve products up front, as in verify_layouts, so only layouts
+        # with something to verify are sent to the worker processes.
+        fields_by_item: dict[str, Optional[dict[str, str]]] = {}
+        jobs: list[tuple[Path, str]] = []
 
-    try:
         for layout_path in layout_files:
             if not layout_path.exists():
                 log_warning(f"Layout file not found: {layout_path}")
@@ -271,41 +428,49 @@ def verify_and_color_excel(
                 log_warning(f"Could not extract Item# from: {layout_path.name}")
                 continue
 
-            # Get product data from Excel
-            product_data = get_product_by_item_number(products_df, item_number)
-            if product_data is None:
+            # Get fields to verify from Excel
+            if item_number not in fields_by_item:
+                fields_by_item[item_number] = get_verification_fields_for_item(products_df, item_number)
+
+            expected_fields = fields_by_item[item_number]
+            if expected_fields is None:
                 log_warning(f"No Excel entry for Item# '{item_number}'")
                 continue
 
-            # Extract fields to verify
-            expected_fields = get_verification_fields(product_data)
             if not expected_fields:
                 log_warning(f"No fields to verify for Item# '{item_number}'")
                 continue
 
-            # Extract text from layout
-            try:
-                layout_text = extract_text_from_layout(layout_path)
-            except (FileNotFoundError, ValueError) as e:
-                log_error(f"Failed to read layout {layout_path.name}: {e}")
+            jobs.append((layout_path, item_number))
+
+        normalized_by_item = _normalize_fields(
+            {item: fields for item, fields in fields_by_item.items() if fields}
+        )
+
+        # Texts are extracted in worker processes and matched here in
+        # submission order, so a later layout for the same Item# still wins.
+        outcomes = _extract_layouts([layout_path for layout_path, _ in jobs], workers)
+        for (layout_path, item_number), (status, payload) in zip(jobs, outcomes, strict=True):
+            if status == "error":
+                log_error(f"Failed to read layout {layout_path.name}: {payload}")
                 continue
 
             # Verify each field
-            layout_text_normalized = normalize_for_matching(layout_text)
+            layout_text_normalized = normalize_for_matching(payload)
+            layout_text_compact = compact_for_matching(layout_text_normalized)
+            expected_normalized = normalized_by_item[item_number]
             field_results: dict[str, bool] = {}
 
-            for field_name, expected_value in expected_fields.items():
+            for field_name, expected_value in fields_by_item[item_number].items():
                 found, _, _ = find_value_in_text(
-                    expected_value, layout_text, layout_text_normalized
+                    expected_value, payload, layout_text_normalized,
+                    expected_normalized[field_name], layout_text_compact,
                 )
                 field_results[field_name] = found
 
             verification_results[item_number] = field_results
             log_info(f"Verified Item# '{item_number}': {sum(field_results.values())}/{len(field_results)} fields matched")
 
-    finally:
-        spinner.stop()
-
     log_info(f"Verified {len(verification_results)} products from layouts.")
 
     # Color the Excel file
@@ -3,11 +3,15 @@
 # Excel cell coloring based on verification results.
 # Uses openpyxl to modify cell background colors while preserving images.
 
+import copy
+import os
+import re
 import shutil
 import zipfile
 import tempfile
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import IO, Callable, Generator, Iterable, Optional
 from dataclasses import dataclass
 
 from openpyxl import load_workbook
@@ -22,6 +26,29 @@ RED_FILL = PatternFill(start_color="FFB6B6", end_color="FFB6B6", fill_type="soli
 YELLOW_FILL = PatternFill(start_color="FFFACD", end_color="FFFACD", fill_type="solid")  # Light yellow - unchecked
 NO_FILL = PatternFill(fill_type=None)  # No background - product not found
 
+# Archive members edited when coloring (the active sheet and the stylesheet)
+_SHEET_PART = 'xl/worksheets/sheet1.xml'
+_STYLES_PART = 'xl/styles.xml'
+
+# Read size when streaming the sheet XML
+_SHEET_CHUNK_SIZE = 1 << 20
+
+# The XML parts are edited as bytes: all the markup we touch is ASCII, so
+# there's no need to decode and re-encode whole (possibly huge) sheets.
+
+# Start tag of a cell in the sheet XML: <c r="B7" s="3" t="s"> (or self-closing)
+_CELL_TAG_RE = re.compile(rb'<c r="([A-Z]+\d+)"([^>]*)>')
+# Style attribute inside a cell start tag
+_CELL_STYLE_RE = re.compile(rb' s="(\d+)"')
+
+# styles.xml patterns
+_FILLS_COUNT_RE = re.compile(rb'<fills count="(\d+)"')
+_CELLXFS_RE = re.compile(rb'<cellXfs count="(\d+)">(.*?)</cellXfs>', re.DOTALL)
+# Individual xf elements: self-closing <xf .../> OR with children <xf ...>...</xf>
+_XF_RE = re.compile(rb'<xf [^>]*/>|<xf [^>]*>.*?</xf>', re.DOTALL)
+_FILL_ID_RE = re.compile(rb'fillId="\d+"')
+_APPLY_FILL_RE = re.compile(rb'applyFill="\d+"')
+
 
 @dataclass
 class CellColorResult:
@@ -59,13 +86,20 @@ def find_column_indices(ws, target_columns: list[str]) -> dict[str, int]:
     column_map = {}
     header_row = 1
 
-    for col_idx, cell in enumerate(ws[header_row], start=1):
-        if cell.value:
-            cell_value = str(cell.value).strip().lower()
-            for target in target_columns:
-                if target.lower().strip() == cell_value:
-                    column_map[target] = col_idx
-                    break
+    # Normalize the targets once; the first target wins if two normalize
+    # to the same header name
+    targets_by_name: dict[str, str] = {}
+    for target in target_columns:
+        targets_by_name.setdefault(target.lower().strip(), target)
+
+    header_values = next(
+        ws.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ()
+    )
+    for col_idx, value in enumerate(header_values, start=1):
+        if value:
+            target = targets_by_name.get(str(value).strip().lower())
+            if target is not None:
+                column_map[target] = col_idx
 
     return column_map
 
@@ -74,6 +108,9 @@ def find_item_row(ws, item_number: str, item_col_idx: int, start_row: int = 2) -
     """
     Find the row number for a given Item#.
 
+    Scans the column on every call; color_excel_cells builds an Item# -> row
+    index once instead, which should be preferred for repeated lookups.
+
     Args:
         ws: openpyxl worksheet
         item_number: The Item# to find
@@ -83,16 +120,24 @@ def find_item_row(ws, item_number: str, item_col_idx: int, start_row: int = 2) -
     Returns:
         Row number (1-based) or None if not found
     """
-    for row_idx in range(start_row, ws.max_row + 1):
-        cell_value = ws.cell(row=row_idx, column=item_col_idx).value
-        if cell_value is not None:
-            if str(cell_value).strip() == str(item_number).strip():
-                return row_idx
+    item_number = str(item_number).strip()
+
+    for row_idx, (cell_value,) in enumerate(
+        ws.iter_rows(min_row=start_row, min_col=item_col_idx, max_col=item_col_idx, values_only=True),
+        start=start_row,
+    ):
+        if cell_value is not None and str(cell_value).strip() == item_number:
+            return row_idx
     return None
 
 
+@lru_cache(maxsize=None)
 def _col_num_to_letter(col: int) -> str:
-    """Convert column number (1-based) to Excel letter (A, B, ..., Z, AA, AB, ...)."""
+    """
+    Convert column number (1-based) to Excel letter (A, B, ..., Z, AA, AB, ...).
+
+    Cached: only a handful of columns are colored, once per colored cell.
+    """
     col_letter = ""
     temp_col = col
     while temp_col > 0:
@@ -101,6 +146,143 @@ def _col_num_to_letter(col: int) -> str:
     return col_letter
 
 
+def _copy_unchanged(original_path: Path, output_path: Path) -> None:
+    """Copy the original workbook to the output path, unless they are the same file."""
+    if not output_path.exists() or not os.path.samefile(original_path, output_path):
+        shutil.copy2(original_path, output_path)
+
+
+@lru_cache(maxsize=256)
+def _xf_with_fill(xf: bytes, fill_id: int) -> bytes:
+    """
+    Return a copy of an xf element with its fillId set and applyFill="1".
+
+    Cached across calls, since workbooks in a batch tend to share the same
+    few base styles.
+    """
+    # Replace or add fillId attribute
+    if b'fillId="' in xf:
+        new_xf = _FILL_ID_RE.sub(b'fillId="%d"' % fill_id, xf)
+    else:
+        # Add fillId after xf tag opening
+        new_xf = xf.replace(b'<xf ', b'<xf fillId="%d" ' % fill_id)
+
+    # Ensure applyFill="1" is set
+    if b'applyFill="' in new_xf:
+        new_xf = _APPLY_FILL_RE.sub(b'applyFill="1"', new_xf)
+    else:
+        new_xf = new_xf.replace(b'<xf ', b'<xf applyFill="1" ')
+
+    return new_xf
+
+
+def _iter_tag_aligned_chunks(fileobj: IO[bytes]) -> Generator[bytes, None, None]:
+    """
+    Read an XML stream in chunks that never split a tag.
+
+    Each chunk ends just before the last "<" read so far. A raw "<" can't
+    appear inside a tag (nor in text), so every tag lies within one chunk.
+    """
+    pending = b""
+    while True:
+        data = fileobj.read(_SHEET_CHUNK_SIZE)
+        if not data:
+            break
+        pending += data
+        cut = pending.rfind(b"<")
+        if cut > 0:
+            yield pending[:cut]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def _restyle_cells(fileobj: IO[bytes], new_styles: dict[bytes, int]) -> Generator[bytes, None, None]:
+    """
+    Stream the sheet XML, setting the style index of the given cells.
+
+    Only the first start tag of each cell ref is rewritten.
+
+    Args:
+        fileobj: The original sheet XML
+        new_styles: Dict mapping cell ref (e.g. b"B7") to its new style index
+    """
+    seen: set[bytes] = set()
+    for chunk in _iter_tag_aligned_chunks(fileobj):
+        pieces = []
+        last_end = 0
+        for tag_match in _CELL_TAG_RE.finditer(chunk):
+            cell_ref = tag_match.group(1)
+            new_style_idx = new_styles.get(cell_ref)
+            if new_style_idx is None or cell_ref in seen:
+                continue
+            seen.add(cell_ref)
+
+            # Update or add the style reference
+            attrs = tag_match.group(2)
+            if _CELL_STYLE_RE.search(attrs):
+                new_tag = b'<c r="' + cell_ref + b'"' + _CELL_STYLE_RE.sub(b' s="%d"' % new_style_idx, attrs) + b'>'
+            else:
+                new_tag = b'<c r="%s" s="%d"%s>' % (cell_ref, new_style_idx, attrs)
+
+            pieces.append(chunk[last_end:tag_match.start()])
+            pieces.append(new_tag)
+            last_end = tag_match.end()
+
+        if pieces:
+            pieces.append(chunk[last_end:])
+            yield b"".join(pieces)
+        else:
+            yield chunk
+
+
+def _rewrite_archive(
+    original_path: Path,
+    output_path: Path,
+    replacements: dict[str, bytes | Callable[[IO[bytes]], Iterable[bytes]]],
+) -> None:
+    """
+    Write a copy of the original xlsx archive with some parts replaced.
+
+    Entries are streamed from the original archive in their original order,
+    keeping each entry's metadata and compression type, so unchanged parts
+    (images, shared strings, ...) never touch the disk uncompressed.
+
+    The copy is written to a temporary file next to the target and moved
+    into place, so coloring in place (output == original) is safe and the
+    output is never left half-written.
+
+    Args:
+        original_path: Path to the original Excel file
+        output_path: Path for the output file
+        replacements: Dict mapping archive member name to its new content, or
+                      to a function streaming the new content (as chunks)
+                      from the original member
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=output_path.suffix)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(original_path, 'r') as src, zipfile.ZipFile(tmp_name, 'w') as dst:
+            for info in src.infolist():
+                # Copy the ZipInfo: writing updates offsets and sizes on it
+                out_info = copy.copy(info)
+                new_data = replacements.get(info.filename)
+                if isinstance(new_data, bytes):
+                    dst.writestr(out_info, new_data)
+                elif new_data is not None:
+                    with src.open(info) as fsrc, dst.open(out_info, 'w') as fdst:
+                        for chunk in new_data(fsrc):
+                            fdst.write(chunk)
+                else:
+                    with src.open(info) as fsrc, dst.open(out_info, 'w') as fdst:
+                        shutil.copyfileobj(fsrc, fdst)
+        shutil.copymode(original_path, tmp_name)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 def _apply_colors_to_original(
     original_path: Path,
     output_path: Path,
@@ -115,15 +297,14 @@ def _apply_colors_to_original(
     3. Appending a copy with only the fillId changed
     4. Using a cache to avoid creating duplicate styles
 
-    Uses careful string manipulation to preserve the original XML structure.
+    Uses careful string manipulation (on the raw bytes) to preserve the
+    original XML structure.
 
     Args:
         original_path: Path to the original Excel file
         output_path: Path for the output file
         cell_styles: Dict mapping (row, col) to color name ("green", "red", "yellow")
     """
-    import re
-
     # Color hex values
     colors = {
         "green": "90EE90",
@@ -131,153 +312,108 @@ def _apply_colors_to_original(
         "yellow": "FFFACD",
     }
 
-    # Copy original to output
-    shutil.copy2(original_path, output_path)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        extract_dir = tmpdir / 'excel'
-
-        # Extract the Excel file
-        with zipfile.ZipFile(output_path, 'r') as z:
-            z.extractall(extract_dir)
-
-        # Read sheet XML to find each cell's current style
-        sheet_path = extract_dir / 'xl' / 'worksheets' / 'sheet1.xml'
-        with open(sheet_path, 'r', encoding='utf-8') as f:
-            sheet_content = f.read()
-
-        # Build a map of cell_ref -> current style index
-        cell_current_styles: dict[str, int] = {}
-        for (row, col), _ in cell_styles.items():
-            cell_ref = f"{_col_num_to_letter(col)}{row}"
-            style_match = re.search(rf'<c r="{cell_ref}"[^>]* s="(\d+)"', sheet_content)
-            if style_match:
-                cell_current_styles[cell_ref] = int(style_match.group(1))
-            else:
-                cell_current_styles[cell_ref] = 0
-
-        # Read styles.xml
-        styles_path = extract_dir / 'xl' / 'styles.xml'
-        with open(styles_path, 'r', encoding='utf-8') as f:
-            styles_content = f.read()
-
-        # Step 1: Add our fill colors to the fills section
-        # Find </fills> and insert before it
-        fills_count_match = re.search(r'<fills count="(\d+)"', styles_content)
-        if not fills_count_match:
-            log_warning("Could not find fills count in styles.xml")
-            return
-
-        existing_fill_count = int(fills_count_match.group(1))
-        fill_indices = {}
-
-        new_fills = ""
-        for i, (color_name, color_hex) in enumerate(colors.items()):
-            fill_indices[color_name] = existing_fill_count + i
-            new_fills += f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color_hex}"/><bgColor indexed="64"/></patternFill></fill>'
-
-        # Update fills count
-        styles_content = styles_content.replace(
-            f'<fills count="{existing_fill_count}"',
-            f'<fills count="{existing_fill_count + 3}"'
-        )
-        # Insert new fills before </fills>
-        styles_content = styles_content.replace('</fills>', f'{new_fills}</fills>')
-
-        # Step 2: Extract all xf elements from cellXfs
-        cellxfs_match = re.search(r'<cellXfs count="(\d+)">(.*?)</cellXfs>', styles_content, re.DOTALL)
-        if not cellxfs_match:
-            log_warning("Could not find cellXfs in styles.xml")
-            return
-
-        xf_count = int(cellxfs_match.group(1))
-        cellxfs_content = cellxfs_match.group(2)
-
-        # Extract individual xf elements (both self-closing and with children)
-        # Pattern: self-closing <xf .../> OR with children <xf ...>...</xf>
-        xf_elements = re.findall(r'<xf [^>]*/>|<xf [^>]*>.*?</xf>', cellxfs_content, re.DOTALL)
-
-        # Cache: (original_style_idx, color_name) -> new_style_idx
-        style_cache: dict[tuple[int, str], int] = {}
-        new_xfs = ""
-
-        for (row, col), color_name in cell_styles.items():
-            cell_ref = f"{_col_num_to_letter(col)}{row}"
-            orig_style_idx = cell_current_styles.get(cell_ref, 0)
-
-            cache_key = (orig_style_idx, color_name)
-            if cache_key not in style_cache:
-                # Get the original xf element
-                if orig_style_idx < len(xf_elements):
-                    orig_xf = xf_elements[orig_style_idx]
-                else:
-                    orig_xf = '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
-
-                # Create new xf by modifying fillId
-                new_fill_id = fill_indices[color_name]
+    # Nothing to color: don't touch the styles or repack the workbook
+    if not cell_styles:
+        _copy_unchanged(original_path, output_path)
+        return
 
-                # Replace or add fillId attribute
-                if 'fillId="' in orig_xf:
-                    new_xf = re.sub(r'fillId="\d+"', f'fillId="{new_fill_id}"', orig_xf)
-                else:
-                    # Add fillId after xf tag opening
-                    new_xf = orig_xf.replace('<xf ', f'<xf fillId="{new_fill_id}" ')
-
-                # Ensure applyFill="1" is set
-                if 'applyFill="' in new_xf:
-                    new_xf = re.sub(r'applyFill="\d+"', 'applyFill="1"', new_xf)
-                else:
-                    new_xf = new_xf.replace('<xf ', '<xf applyFill="1" ')
-
-                new_xfs += new_xf
-                style_cache[cache_key] = xf_count
-                xf_count += 1
+    # Cell ref -> color name for the cells to color
+    colors_by_ref = {
+        f"{_col_num_to_letter(col)}{row}".encode('ascii'): color_name
+        for (row, col), color_name in cell_styles.items()
+    }
 
-        # Update cellXfs count and add new xf elements
-        styles_content = styles_content.replace(
-            f'<cellXfs count="{cellxfs_match.group(1)}"',
-            f'<cellXfs count="{xf_count}"'
-        )
-        styles_content = styles_content.replace('</cellXfs>', f'{new_xfs}</cellXfs>')
+    # Build a map of cell_ref -> current style index in a single streamed
+    # pass over the sheet (first occurrence of each ref), so the sheet is
+    # never held in memory whole. styles.xml is small and read at once.
+    cell_current_styles: dict[bytes, int] = dict.fromkeys(colors_by_ref, 0)
+    seen: set[bytes] = set()
+    with zipfile.ZipFile(original_path, 'r') as z:
+        styles_content = z.read(_STYLES_PART)
+        with z.open(_SHEET_PART) as sheet_file:
+            for chunk in _iter_tag_aligned_chunks(sheet_file):
+                for tag_match in _CELL_TAG_RE.finditer(chunk):
+                    cell_ref = tag_match.group(1)
+                    if cell_ref in colors_by_ref and cell_ref not in seen:
+                        seen.add(cell_ref)
+                        style_match = _CELL_STYLE_RE.search(tag_match.group(2))
+                        if style_match:
+                            cell_current_styles[cell_ref] = int(style_match.group(1))
+
+    # Step 1: Add our fill colors to the fills section
+    # Find </fills> and insert before it
+    fills_count_match = _FILLS_COUNT_RE.search(styles_content)
+    if not fills_count_match:
+        log_warning("Could not find fills count in styles.xml")
+        _copy_unchanged(original_path, output_path)
+        return
+
+    existing_fill_count = int(fills_count_match.group(1))
+    fill_indices = {}
+
+    new_fills = b""
+    for i, (color_name, color_hex) in enumerate(colors.items()):
+        fill_indices[color_name] = existing_fill_count + i
+        new_fills += f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color_hex}"/><bgColor indexed="64"/></patternFill></fill>'.encode('ascii')
+
+    # Update fills count
+    styles_content = styles_content.replace(
+        b'<fills count="%d"' % existing_fill_count,
+        b'<fills count="%d"' % (existing_fill_count + 3)
+    )
+    # Insert new fills before </fills>
+    styles_content = styles_content.replace(b'</fills>', new_fills + b'</fills>')
+
+    # Step 2: Extract all xf elements from cellXfs
+    cellxfs_match = _CELLXFS_RE.search(styles_content)
+    if not cellxfs_match:
+        log_warning("Could not find cellXfs in styles.xml")
+        _copy_unchanged(original_path, output_path)
+        return
+
+    xf_count = int(cellxfs_match.group(1))
+    cellxfs_content = cellxfs_match.group(2)
+
+    # Extract individual xf elements (both self-closing and with children)
+    xf_elements = _XF_RE.findall(cellxfs_content)
+
+    # Cache: (original_style_idx, color_name) -> new_style_idx
+    style_cache: dict[tuple[int, str], int] = {}
+    new_xfs = b""
+
+    for cell_ref, color_name in colors_by_ref.items():
+        orig_style_idx = cell_current_styles[cell_ref]
+
+        cache_key = (orig_style_idx, color_name)
+        if cache_key not in style_cache:
+            # Get the original xf element
+            if orig_style_idx < len(xf_elements):
+                orig_xf = xf_elements[orig_style_idx]
+            else:
+                orig_xf = b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
 
-        # Save modified styles.xml
-        with open(styles_path, 'w', encoding='utf-8') as f:
-            f.write(styles_content)
+            # Create new xf by modifying fillId
+            new_xfs += _xf_with_fill(orig_xf, fill_indices[color_name])
+            style_cache[cache_key] = xf_count
+            xf_count += 1
 
-        # Step 3: Update sheet XML to apply new styles to cells
-        for (row, col), color_name in cell_styles.items():
-            cell_ref = f"{_col_num_to_letter(col)}{row}"
-            orig_style_idx = cell_current_styles.get(cell_ref, 0)
-            new_style_idx = style_cache[(orig_style_idx, color_name)]
+    # Update cellXfs count and add new xf elements
+    styles_content = styles_content.replace(
+        b'<cellXfs count="' + cellxfs_match.group(1) + b'"',
+        b'<cellXfs count="%d"' % xf_count
+    )
+    styles_content = styles_content.replace(b'</cellXfs>', new_xfs + b'</cellXfs>')
 
-            # Update or add the style reference
-            cell_with_style = rf'(<c r="{cell_ref}"[^>]*) s="\d+"([^>]*>)'
-            cell_without_style = rf'(<c r="{cell_ref}")([^>]*>)'
-
-            if re.search(cell_with_style, sheet_content):
-                sheet_content = re.sub(
-                    cell_with_style,
-                    rf'\1 s="{new_style_idx}"\2',
-                    sheet_content
-                )
-            elif re.search(cell_without_style, sheet_content):
-                sheet_content = re.sub(
-                    cell_without_style,
-                    rf'\1 s="{new_style_idx}"\2',
-                    sheet_content
-                )
-
-        # Save modified sheet
-        with open(sheet_path, 'w', encoding='utf-8') as f:
-            f.write(sheet_content)
-
-        # Repack the Excel file
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as z:
-            for file_path in extract_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(extract_dir).as_posix()
-                    z.write(file_path, arcname)
+    # Step 3: Update sheet XML to apply new styles to cells, streaming it
+    # into the output archive
+    new_styles = {
+        cell_ref: style_cache[(cell_current_styles[cell_ref], color_name)]
+        for cell_ref, color_name in colors_by_ref.items()
+    }
+    _rewrite_archive(original_path, output_path, {
+        _SHEET_PART: partial(_restyle_cells, new_styles=new_styles),
+        _STYLES_PART: styles_content,
+    })
 
 
 def color_excel_cells(
@@ -310,10 +446,16 @@ def color_excel_cells(
     # Determine save path
     save_path = Path(output_path) if output_path else excel_path
 
-    # Load workbook just to read structure (we won't save via openpyxl)
+    # Load workbook just to read structure (we won't save via openpyxl).
+    # Read-only mode streams the sheet XML instead of materializing every
+    # cell, style and drawing. Formulas are read as their text (not cached
+    # values), as before, so formula cells are still matched and colored.
     log_info(f"Loading Excel file: {excel_path.name}")
-    wb = load_workbook(excel_path)
+    wb = load_workbook(excel_path, read_only=True)
     ws = wb.active
+    # Don't trust the stored sheet dimensions, which some writers get wrong
+    # and read-only iteration would stop at
+    ws.reset_dimensions()
 
     # Determine columns to process
     if columns_to_check is None:
@@ -327,10 +469,33 @@ def color_excel_cells(
     column_indices = find_column_indices(ws, columns_to_check)
 
     if "Item#" not in column_indices:
+        wb.close()
         raise ValueError("Could not find 'Item#' column in Excel file")
 
     item_col_idx = column_indices["Item#"]
 
+    # Rightmost column we read from, to bound each row
+    max_col_idx = max(column_indices.values())
+
+    # Read the data rows in a single pass (every iter_rows call re-parses the
+    # sheet in read-only mode), indexing Item# -> (row, values) for the
+    # verified items only. The first occurrence wins, as with find_item_row.
+    wanted_items = {str(item_number).strip() for item_number in verification_results}
+    item_rows: dict[str, tuple[int, tuple]] = {}
+    for row_idx, row_values in enumerate(
+        ws.iter_rows(min_row=2, max_col=max_col_idx, values_only=True),
+        start=2,
+    ):
+        cell_value = row_values[item_col_idx - 1]
+        if cell_value is None:
+            continue
+        item_key = str(cell_value).strip()
+        if item_key in wanted_items and item_key not in item_rows:
+            item_rows[item_key] = (row_idx, row_values)
+
+    # Close workbook without saving
+    wb.close()
+
     # Track results and cell styles to apply
     result = ColoringResult(
         excel_path=str(excel_path),
@@ -348,15 +513,16 @@ def color_excel_cells(
     # Process each item in verification results
     items_processed = set()
     for item_number, field_results in verification_results.items():
-        row_idx = find_item_row(ws, item_number, item_col_idx)
+        item_row = item_rows.get(str(item_number).strip())
 
-        if row_idx is None:
+        if item_row is None:
             log_warning(f"Item# '{item_number}' not found in Excel")
             result.products_not_found += 1
             continue
 
         result.products_found += 1
         items_processed.add(item_number)
+        row_idx, row_values = item_row
 
         # Color each field cell for this product
         for field_name, matched in field_results.items():
@@ -364,8 +530,8 @@ def color_excel_cells(
                 continue
 
             col_idx = column_indices[field_name]
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell_value = str(cell.value) if cell.value else ""
+            raw_value = row_values[col_idx - 1]
+            cell_value = str(raw_value)[:50] if raw_value else ""
 
             if matched:
                 cell_styles[(row_idx, col_idx)] = "green"
@@ -381,7 +547,7 @@ def color_excel_cells(
                 column=field_name,
                 color=color,
                 field_name=field_name,
-                value=cell_value[:50] if cell_value else "",
+                value=cell_value,
             ))
 
         # Color unchecked columns (columns we have in Excel but weren't verified)
@@ -389,9 +555,10 @@ def color_excel_cells(
             if col_name == "Item#":
                 continue
             if col_name not in field_results:
-                cell = ws.cell(row=row_idx, column=col_idx)
+                raw_value = row_values[col_idx - 1]
                 # Only color if cell has a value
-                if cell.value:
+                if raw_value:
+                    cell_value = str(raw_value)[:50]
                     cell_styles[(row_idx, col_idx)] = "yellow"
                     result.cells_yellow += 1
                     result.cell_details.append(CellColorResult(
@@ -399,12 +566,9 @@ def color_excel_cells(
                         column=col_name,
                         color="yellow",
                         field_name=col_name,
-                        value=str(cell.value)[:50] if cell.value else "",
+                        value=cell_value,
                     ))
 
-    # Close workbook without saving
-    wb.close()
-
     # Apply colors directly to the original Excel file (preserves images)
     log_info(f"Applying colors to Excel (preserving images)...")
     _apply_colors_to_original(excel_path, save_path, cell_styles)
@@ -5,9 +5,16 @@ Reads product information from an Excel file where each row represents a product
 and columns contain product attributes like Item#, EAN, descriptions, etc.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-import pandas as pd
-from typing import Optional
+import hashlib
+import os
+import pickle
+import weakref
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .logging_utils import log_info, log_error, log_warning
 
@@ -25,15 +32,126 @@ DEFAULT_COLUMNS = [
     "Batch no:",
 ]
 
+# Opt-in on-disk cache of loaded product tables (set LAYOUT_VERIFIER_CACHE=1).
+# Entries are keyed by file path, mtime, size, sheet and columns, so editing
+# the workbook invalidates them automatically.
+CACHE_ENV_VAR = "LAYOUT_VERIFIER_CACHE"
+CACHE_DIR = Path.home() / ".cache" / "layout_verifier"
+# Bump whenever what load_product_data caches changes, so entries written by
+# older versions are never served
+CACHE_FORMAT_VERSION = 3
+# Most recently written entries kept; older ones are pruned on each write
+CACHE_MAX_ENTRIES = 32
+
+
+@dataclass
+class _ProductLookups:
+    """Pre-built per-Item# dicts for a frame returned by load_product_data."""
+    frame_ref: "weakref.ref[pd.DataFrame]"
+    records: dict[str, dict]
+    verification_records: dict[str, dict[str, str]]
+
+
+# Lookups by id() of the frame they were built for. Kept outside the frame:
+# pandas deep-copies DataFrame.attrs into every derived object, so storing
+# them there would copy both dicts on each column access, filter, etc.
+_PRODUCT_LOOKUPS: dict[int, _ProductLookups] = {}
+
+
+def _attach_lookups(
+    df: "pd.DataFrame",
+    records: dict[str, dict],
+    verification_records: dict[str, dict[str, str]],
+) -> None:
+    """Register the lookups for a frame; they are dropped when it is freed."""
+    key = id(df)
+    _PRODUCT_LOOKUPS[key] = _ProductLookups(weakref.ref(df), records, verification_records)
+    weakref.finalize(df, _PRODUCT_LOOKUPS.pop, key, None)
+
+
+def _get_lookups(df: "pd.DataFrame") -> Optional[_ProductLookups]:
+    """Return the lookups built for exactly this frame, if any."""
+    lookups = _PRODUCT_LOOKUPS.get(id(df))
+    if lookups is None or lookups.frame_ref() is not df:
+        return None
+    return lookups
+
+
+def _build_lookups(
+    result_df: "pd.DataFrame",
+) -> tuple[dict[str, dict], dict[str, dict[str, str]]]:
+    """
+    Pre-convert rows to dicts once so lookups skip per-call pandas overhead,
+    and clean the fields to verify column-wise instead of per cell.
+
+    Keyed by Item#; the first row wins for duplicated Item# values.
+    """
+    import pandas as pd
+
+    item_numbers = result_df["Item#"].tolist()
+    values = result_df.drop(columns="Item#").apply(lambda col: col.str.strip())
+    lowered = values.apply(lambda col: col.str.lower())
+    values = values.mask(values.isna() | lowered.isin(["", "nan"]))
+
+    records: dict[str, dict] = {}
+    verification_records: dict[str, dict[str, str]] = {}
+    for item, row, cleaned in zip(
+        item_numbers, result_df.to_dict(orient="records"), values.to_dict(orient="records")
+    ):
+        if item not in records:
+            records[item] = row
+            verification_records[item] = {
+                key: value for key, value in cleaned.items() if not pd.isna(value)
+            }
+    return records, verification_records
+
+
+def _product_cache_path(
+    excel_path: Path,
+    sheet_name: str | int,
+    columns: list[str],
+) -> Path:
+    """Build the cache file path for a given workbook and column selection."""
+    stat = excel_path.stat()
+    key_source = (
+        f"v{CACHE_FORMAT_VERSION}:{excel_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{sheet_name}:{columns}"
+    )
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.pkl"
+
+
+def _prune_product_cache(max_entries: int = CACHE_MAX_ENTRIES) -> None:
+    """Delete all but the most recently written cache entries."""
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            cached = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.name.endswith(".pkl") and entry.is_file()
+            ]
+    except OSError:
+        return
+
+    cached.sort(reverse=True)
+    for _, path in cached[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 
 def load_product_data(
     excel_path: str | Path,
     sheet_name: str | int = 0,
     columns: Optional[list[str]] = None,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Load product data from an Excel file.
 
+    If the LAYOUT_VERIFIER_CACHE environment variable is set to "1", the
+    result is cached on disk and reused while the workbook is unchanged.
+
     Args:
         excel_path: Path to the Excel file containing product data.
         sheet_name: Name or index of the worksheet to read (default: first sheet).
@@ -41,12 +159,14 @@ def load_product_data(
                  Only columns that exist in the Excel file will be returned.
 
     Returns:
-        DataFrame with product data, indexed by Item# if that column exists.
+        DataFrame with product data.
 
     Raises:
         FileNotFoundError: If the Excel file doesn't exist.
         ValueError: If the Excel file cannot be read or has no valid data.
     """
+    import pandas as pd
+
     excel_path = Path(excel_path)
 
     if not excel_path.exists():
@@ -55,67 +175,122 @@ def load_product_data(
     if not excel_path.suffix.lower() in (".xlsx", ".xls", ".xlsm"):
         raise ValueError(f"Not a valid Excel file: {excel_path}")
 
+    # Determine which columns to use
+    target_columns = columns if columns is not None else DEFAULT_COLUMNS
+
+    cache_path = None
+    if os.environ.get(CACHE_ENV_VAR) == "1":
+        cache_path = _product_cache_path(excel_path, sheet_name, list(target_columns))
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    result_df, lookups = pickle.load(f)
+                if lookups is not None:
+                    _attach_lookups(result_df, *lookups)
+                log_info(f"Loaded {len(result_df)} products from cache for: {excel_path.name}")
+                return result_df
+            except Exception as e:
+                log_warning(f"Ignoring unreadable product cache {cache_path.name}: {e}")
+
     log_info(f"Loading product data from: {excel_path.name}")
 
     try:
-        df = pd.read_excel(excel_path, sheet_name=sheet_name)
+        # Read the header row only, so the real read can be restricted to
+        # the columns we need. calamine (Rust) parses .xlsx/.xlsm/.xls much
+        # faster than openpyxl/xlrd.
+        header_df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="calamine", nrows=0)
     except Exception as e:
         raise ValueError(f"Failed to read Excel file: {e}")
 
-    if df.empty:
+    if header_df.columns.empty:
         raise ValueError("Excel file contains no data")
 
-    # Determine which columns to use
-    target_columns = columns if columns is not None else DEFAULT_COLUMNS
-
-    # Find columns that exist in the dataframe (case-insensitive matching)
-    df_columns_lower = {col.lower().strip(): col for col in df.columns}
+    # Find columns that exist in the header (case-insensitive matching)
+    df_columns_lower = {col.lower().strip(): col for col in header_df.columns}
     available_columns = []
     column_mapping = {}
+    missing = []
 
     for col in target_columns:
-        col_lower = col.lower().strip()
-        if col_lower in df_columns_lower:
-            original_col = df_columns_lower[col_lower]
+        original_col = df_columns_lower.get(col.lower().strip())
+        if original_col is None:
+            missing.append(col)
+        else:
             available_columns.append(original_col)
             column_mapping[original_col] = col
 
     if not available_columns:
         raise ValueError(
             f"None of the expected columns found in Excel. "
-            f"Expected: {target_columns}, Found: {list(df.columns)}"
+            f"Expected: {target_columns}, Found: {list(header_df.columns)}"
+        )
+
+    try:
+        # Only materialize the resolved columns, as native strings
+        df = pd.read_excel(
+            excel_path,
+            sheet_name=sheet_name,
+            engine="calamine",
+            usecols=available_columns,
+            dtype="string",
         )
+    except Exception as e:
+        raise ValueError(f"Failed to read Excel file: {e}")
+
+    if df.empty:
+        raise ValueError("Excel file contains no data")
 
     # Report missing columns
-    missing = set(c.lower().strip() for c in target_columns) - set(
-        c.lower().strip() for c in available_columns
-    )
     if missing:
         log_warning(f"Some columns not found in Excel: {missing}")
 
-    # Select and rename columns to standardized names
-    result_df = df[available_columns].copy()
+    # Select and rename columns to standardized names. A list selection via
+    # .loc already returns a new frame, so the labels are set on it directly
+    # rather than through rename(), which would copy again.
+    result_df = df.loc[:, available_columns]
     result_df.columns = [column_mapping[col] for col in available_columns]
 
     # Ensure Item# column exists for indexing
     if "Item#" in result_df.columns:
-        # Convert Item# to string and strip whitespace
-        result_df["Item#"] = result_df["Item#"].astype(str).str.strip()
-        # Remove rows with empty Item#
-        result_df = result_df[result_df["Item#"].notna() & (result_df["Item#"] != "")]
-        result_df = result_df[result_df["Item#"] != "nan"]
+        # Strip whitespace and drop rows with empty Item# in a single filter
+        # (column is already read as strings)
+        item_numbers = result_df["Item#"].str.strip()
+        valid = item_numbers.notna() & (item_numbers != "") & (item_numbers.str.lower() != "nan")
+        result_df = result_df.loc[valid].assign(**{"Item#": item_numbers[valid]})
+
+        # Duplicated rows stay in the frame (and in the product count); the
+        # Item# lookups below use the first of them
+        duplicated = result_df["Item#"].duplicated(keep="first")
+        if duplicated.any():
+            duplicates = sorted(set(result_df.loc[duplicated, "Item#"]))
+            log_warning(f"Multiple products found with Item# {duplicates}, using first")
+
+    lookups = None
+    if "Item#" in result_df.columns:
+        lookups = _build_lookups(result_df)
+        _attach_lookups(result_df, *lookups)
 
     log_info(f"Loaded {len(result_df)} products with {len(result_df.columns)} columns")
 
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((result_df, lookups), f, protocol=pickle.HIGHEST_PROTOCOL)
+            _prune_product_cache()
+        except OSError as e:
+            log_warning(f"Could not write product cache: {e}")
+
     return result_df
 
 
-def get_product_by_item_number(df: pd.DataFrame, item_number: str) -> Optional[dict]:
+def get_product_by_item_number(df: "pd.DataFrame", item_number: str) -> Optional[dict]:
     """
     Get a single product's data by its Item#.
 
     Args:
-        df: DataFrame with product data (must have 'Item#' column).
+        df: DataFrame with product data (must have 'Item#' column). Frames
+            returned by load_product_data are served from pre-built row dicts.
         item_number: The item number to look up.
 
     Returns:
@@ -126,15 +301,30 @@ def get_product_by_item_number(df: pd.DataFrame, item_number: str) -> Optional[d
         return None
 
     item_number = str(item_number).strip()
-    matches = df[df["Item#"] == item_number]
 
-    if matches.empty:
+    # Frames from load_product_data have pre-built row dicts; hand out a
+    # copy so callers can't modify the cached one
+    lookups = _get_lookups(df)
+    if lookups is not None:
+        record = lookups.records.get(item_number)
+        return dict(record) if record is not None else None
+
+    # Otherwise fall back to an Item# index lookup
+    import pandas as pd
+
+    if df.index.name != "Item#":
+        df = df.set_index("Item#", drop=False)
+
+    try:
+        row = df.loc[item_number]
+    except KeyError:
         return None
 
-    if len(matches) > 1:
+    if isinstance(row, pd.DataFrame):
         log_warning(f"Multiple products found with Item# '{item_number}', using first")
+        row = row.iloc[0]
 
-    return matches.iloc[0].to_dict()
+    return row.to_dict()
 
 
 def get_verification_fields(product_data: dict) -> dict[str, str]:
@@ -149,6 +339,8 @@ def get_verification_fields(product_data: dict) -> dict[str, str]:
     Returns:
         Dictionary of field_name -> value for non-empty fields.
     """
+    import pandas as pd
+
     verification_fields = {}
 
     for key, value in product_data.items():
@@ -162,3 +354,30 @@ def get_verification_fields(product_data: dict) -> dict[str, str]:
             verification_fields[key] = str_value
 
     return verification_fields
+
+
+def get_verification_fields_for_item(df: "pd.DataFrame", item_number: str) -> Optional[dict[str, str]]:
+    """
+    Get the fields to verify for a product, looked up by its Item#.
+
+    Frames returned by load_product_data have these pre-cleaned, so this is
+    a dictionary lookup; other frames fall back to get_product_by_item_number
+    followed by get_verification_fields.
+
+    Args:
+        df: DataFrame with product data (must have 'Item#' column).
+        item_number: The item number to look up.
+
+    Returns:
+        Dictionary of field_name -> value for non-empty fields, or None if
+        the product is not found.
+    """
+    lookups = _get_lookups(df)
+    if lookups is not None:
+        fields = lookups.verification_records.get(str(item_number).strip())
+        return dict(fields) if fields is not None else None
+
+    product_data = get_product_by_item_number(df, item_number)
+    if product_data is None:
+        return None
+    return get_verification_fields(product_data)
@@ -10,23 +10,70 @@ Note: PDFs with text converted to curves/outlines cannot be read without OCR.
 For such cases, use the original .ai file which typically preserves text layers.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Generator
+from typing import Generator, TYPE_CHECKING
+import importlib.util
+import multiprocessing
+import os
 import re
 
-import fitz  # PyMuPDF
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
 
 from .logging_utils import log_info, log_error, log_warning
 
 
-# Try to import barcode decoding library
-try:
-    from pyzbar import pyzbar
-    from PIL import Image
-    import io
-    BARCODE_SUPPORT = True
-except ImportError:
-    BARCODE_SUPPORT = False
+# Check for the barcode decoding library without importing it; pyzbar loads
+# the native zbar library, so it is imported only when barcodes are decoded
+BARCODE_SUPPORT = importlib.util.find_spec("pyzbar") is not None
+
+
+# Precompiled pattern for text normalization
+_WS_RE = re.compile(r"\s+")
+
+# Barcodes of files with fewer pages are rendered serially; below this a
+# process pool costs more to start than it saves
+BARCODE_POOL_MIN_PAGES = 4
+
+
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for the extraction and barcode pools.
+
+    Workers must not be forked from the main process: pools are started
+    while the Spinner thread writes to stdout, and a child forked while that
+    thread holds the stdout lock would hang on its first write. forkserver
+    (or spawn, where forkserver isn't available) starts workers from a
+    clean interpreter instead.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _extract_page_text_parts(page: "fitz.Page") -> list[str]:
+    """
+    Collect the text of a page with a single PyMuPDF "dict" traversal.
+
+    Returns the page text (span texts joined per line, lines joined by
+    newlines, equivalent to get_text("text")) followed by every individual
+    span, which keeps rotated or positioned text matchable on its own.
+    """
+    line_texts = []
+    span_texts = []
+
+    for block in page.get_text("dict").get("blocks", []):
+        if block.get("type") != 0:  # Text blocks only
+            continue
+        for line in block.get("lines", []):
+            spans = [span.get("text", "") for span in line.get("spans", [])]
+            line_texts.append("".join(spans))
+            span_texts.extend(text for text in spans if text)
+
+    page_text = "\n".join(line_texts)
+    return ([page_text] if page_text else []) + span_texts
 
 
 def extract_text_from_pdf(pdf_path: str | Path) -> str:
@@ -53,6 +100,8 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
     if pdf_path.suffix.lower() not in (".pdf", ".ai"):
         raise ValueError(f"Not a PDF/AI file: {pdf_path}")
 
+    import fitz  # PyMuPDF
+
     try:
         doc = fitz.open(pdf_path)
     except Exception as e:
@@ -60,31 +109,8 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
 
     all_text_parts = []
 
-    for page_num, page in enumerate(doc):
-        # Extract text using different methods to maximize coverage
-
-        # Method 1: Standard text extraction
-        text = page.get_text("text")
-        if text:
-            all_text_parts.append(text)
-
-        # Method 2: Extract text from text blocks (handles some rotated text)
-        blocks = page.get_text("blocks")
-        for block in blocks:
-            if len(block) >= 5 and isinstance(block[4], str):
-                block_text = block[4]
-                if block_text and block_text not in all_text_parts:
-                    all_text_parts.append(block_text)
-
-        # Method 3: Dictionary-based extraction for detailed text info
-        text_dict = page.get_text("dict")
-        for block in text_dict.get("blocks", []):
-            if block.get("type") == 0:  # Text block
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        span_text = span.get("text", "")
-                        if span_text:
-                            all_text_parts.append(span_text)
+    for page in doc:
+        all_text_parts.extend(_extract_page_text_parts(page))
 
     doc.close()
 
@@ -119,26 +145,15 @@ def extract_text_from_ai(ai_path: str | Path) -> str:
     if ai_path.suffix.lower() != ".ai":
         raise ValueError(f"Not an AI file: {ai_path}")
 
+    import fitz  # PyMuPDF
+
     all_text_parts = []
 
     # Read AI file as PDF (AI files are PDF-compatible)
     try:
         doc = fitz.open(ai_path)
         for page in doc:
-            # Standard text extraction
-            text = page.get_text("text")
-            if text:
-                all_text_parts.append(text)
-
-            # Dictionary extraction for additional coverage
-            text_dict = page.get_text("dict")
-            for block in text_dict.get("blocks", []):
-                if block.get("type") == 0:
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            span_text = span.get("text", "")
-                            if span_text:
-                                all_text_parts.append(span_text)
+            all_text_parts.extend(_extract_page_text_parts(page))
         doc.close()
     except Exception as e:
         raise ValueError(f"Could not read AI file: {e}")
@@ -147,97 +162,53 @@ def extract_text_from_ai(ai_path: str | Path) -> str:
     return combined_text
 
 
-def _extract_text_from_ai_raw(ai_path: Path) -> str:
-    """
-    Extract text strings from raw AI file content.
+def _render_and_decode(page: "fitz.Page", zoom: float) -> list[tuple[str, str]]:
+    """Render a page at the given zoom and decode any barcodes on it."""
+    import fitz  # PyMuPDF
+    from pyzbar import pyzbar
 
-    AI files contain PostScript code where text is often encoded as:
-    - Strings in parentheses: (Text here)
-    - Hex strings: <48656C6C6F>
-    - Text operators like Tj, TJ, '
+    # pyzbar only needs luma, so render 8-bit grayscale and hand it the
+    # raw samples directly
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
 
-    This function extracts readable text from these structures.
-    """
-    text_parts = []
+    barcodes = []
+    for barcode in pyzbar.decode((pix.samples, pix.width, pix.height)):
+        barcode_data = barcode.data.decode("utf-8", errors="ignore")
+        if barcode_data:
+            barcodes.append((barcode.type, barcode_data))
+    return barcodes
 
-    # Read file in binary mode and try to decode
-    try:
-        with open(ai_path, "rb") as f:
-            content = f.read()
-    except Exception:
-        return ""
 
-    # Try UTF-8 first, then latin-1 as fallback
-    try:
-        text_content = content.decode("utf-8", errors="ignore")
-    except Exception:
-        text_content = content.decode("latin-1", errors="ignore")
-
-    # Pattern 1: Text in parentheses (PostScript strings)
-    # Match strings like (Hello World) but handle escaped parentheses
-    paren_pattern = re.compile(r"\(([^()\\]*(?:\\.[^()\\]*)*)\)")
-    for match in paren_pattern.finditer(text_content):
-        text = match.group(1)
-        # Unescape PostScript escape sequences
-        text = _unescape_postscript_string(text)
-        if text and len(text) >= 2 and _is_readable_text(text):
-            text_parts.append(text)
-
-    # Pattern 2: Look for BT...ET blocks (PDF text objects)
-    bt_et_pattern = re.compile(r"BT\s*(.*?)\s*ET", re.DOTALL)
-    for match in bt_et_pattern.finditer(text_content):
-        block = match.group(1)
-        # Extract text from Tj and TJ operators within the block
-        tj_matches = re.findall(r"\(([^)]+)\)\s*Tj", block)
-        for text in tj_matches:
-            text = _unescape_postscript_string(text)
-            if text and _is_readable_text(text):
-                text_parts.append(text)
-
-    return " ".join(text_parts)
-
-
-def _unescape_postscript_string(s: str) -> str:
-    """Unescape PostScript string escape sequences."""
-    # Common escape sequences
-    replacements = [
-        (r"\\n", "\n"),
-        (r"\\r", "\r"),
-        (r"\\t", "\t"),
-        (r"\\(", "("),
-        (r"\\)", ")"),
-        (r"\\\\", "\\"),
-    ]
-    result = s
-    for old, new in replacements:
-        result = result.replace(old, new)
-    return result
-
-
-def _is_readable_text(text: str) -> bool:
+def _decode_barcodes_on_page(page: "fitz.Page") -> list[tuple[str, str]]:
     """
-    Check if extracted text is likely to be human-readable content.
+    Render a page and decode its barcodes.
 
-    Filters out binary data, control characters, and PostScript operators.
+    Returns:
+        List of (barcode_type, barcode_data) tuples found on the page.
     """
-    if not text:
-        return False
+    # 2x zoom (144 DPI) is enough for typical retail barcodes and has
+    # under half the pixels of 3x (216 DPI). Re-render at 3x whenever
+    # nothing was found; a page where 2x already decoded a symbol is not
+    # re-rendered, so a second symbol only readable at 3x is missed.
+    barcodes = _render_and_decode(page, 2)
+    if not barcodes:
+        barcodes = _render_and_decode(page, 3)
+    return barcodes
+
 
-    # Filter out very short strings (likely not meaningful text)
-    if len(text) < 2:
-        return False
+def _decode_page_barcodes(file_path: str, page_num: int) -> list[tuple[str, str]]:
+    """
+    Render a single page and decode its barcodes.
 
-    # Filter out strings that are mostly non-printable
-    printable_ratio = sum(1 for c in text if c.isprintable() or c.isspace()) / len(text)
-    if printable_ratio < 0.8:
-        return False
+    Top-level so it can run in a worker process; opens its own document.
 
-    # Filter out known PostScript/PDF operators
-    operators = {"Tm", "Td", "Tf", "Tj", "TJ", "cm", "re", "rg", "RG", "gs", "CS", "cs"}
-    if text.strip() in operators:
-        return False
+    Returns:
+        List of (barcode_type, barcode_data) tuples found on the page.
+    """
+    import fitz  # PyMuPDF
 
-    return True
+    with fitz.open(file_path) as doc:
+        return _decode_barcodes_on_page(doc[page_num])
 
 
 def extract_barcodes_from_layout(file_path: str | Path) -> list[tuple[str, str]]:
@@ -245,7 +216,10 @@ def extract_barcodes_from_layout(file_path: str | Path) -> list[tuple[str, str]]
     Extract barcodes from a layout file by rendering it to an image.
 
     Renders each page at high resolution and uses pyzbar to decode any
-    barcodes (EAN-13, QR codes, etc.) present in the layout.
+    barcodes (EAN-13, QR codes, etc.) present in the layout. Files with at
+    least BARCODE_POOL_MIN_PAGES pages are rendered in parallel across
+    processes, unless this is already running inside a worker process; if
+    the pool fails, the pages are rendered serially instead.
 
     Args:
         file_path: Path to the layout file (.pdf or .ai).
@@ -255,7 +229,14 @@ def extract_barcodes_from_layout(file_path: str | Path) -> list[tuple[str, str]]
         Returns empty list if pyzbar is not available or no barcodes found.
     """
     if not BARCODE_SUPPORT:
-        log_warning("Barcode support not available (install pyzbar and Pillow)")
+        log_warning("Barcode support not available (install pyzbar)")
+        return []
+
+    try:
+        # pyzbar is installed, but the native zbar library may still be missing
+        from pyzbar import pyzbar  # noqa: F401
+    except ImportError as e:
+        log_warning(f"Barcode support not available: {e}")
         return []
 
     file_path = Path(file_path)
@@ -263,32 +244,40 @@ def extract_barcodes_from_layout(file_path: str | Path) -> list[tuple[str, str]]
     if not file_path.exists():
         return []
 
+    import fitz  # PyMuPDF
+
     barcodes_found = []
 
     try:
-        doc = fitz.open(file_path)
-
-        for page_num, page in enumerate(doc):
-            # Render page at high resolution for better barcode detection
-            # Using 3x zoom (216 DPI) for good quality
-            mat = fitz.Matrix(3, 3)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to PIL Image
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-
-            # Decode barcodes
-            decoded = pyzbar.decode(img)
-
-            for barcode in decoded:
-                barcode_type = barcode.type
-                barcode_data = barcode.data.decode("utf-8", errors="ignore")
-                if barcode_data:
-                    barcodes_found.append((barcode_type, barcode_data))
-                    log_info(f"Found {barcode_type} barcode: {barcode_data}")
-
-        doc.close()
+        # Few pages, or already in a worker: render every page from this
+        # one open document. Only pool workers open their own.
+        page_results = None
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+            workers = min(page_count, os.cpu_count() or 1)
+            use_pool = (
+                page_count >= BARCODE_POOL_MIN_PAGES
+                and workers > 1
+                and multiprocessing.parent_process() is None
+            )
+            if not use_pool:
+                page_results = [_decode_barcodes_on_page(page) for page in doc]
+
+        if page_results is None:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_get_mp_context()) as executor:
+                    page_results = list(executor.map(
+                        _decode_page_barcodes, repeat(str(file_path)), range(page_count)
+                    ))
+            except Exception as e:
+                log_warning(f"Parallel barcode decoding failed for {file_path}, decoding serially: {e}")
+                with fitz.open(file_path) as doc:
+                    page_results = [_decode_barcodes_on_page(page) for page in doc]
+
+        for page_barcodes in page_results:
+            for barcode_type, barcode_data in page_barcodes:
+                barcodes_found.append((barcode_type, barcode_data))
+                log_info(f"Found {barcode_type} barcode: {barcode_data}")
 
     except Exception as e:
         log_error(f"Error extracting barcodes from {file_path}: {e}")
@@ -318,12 +307,16 @@ def extract_text_from_layout(file_path: str | Path, include_barcodes: bool = Tru
     file_path = Path(file_path)
     suffix = file_path.suffix.lower()
 
+    if suffix not in (".ai", ".pdf"):
+        raise ValueError(f"Unsupported file type: {suffix}. Use .pdf or .ai files.")
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"Layout file not found: {file_path}")
+
     if suffix == ".ai":
         text = extract_text_from_ai(file_path)
-    elif suffix == ".pdf":
-        text = extract_text_from_pdf(file_path)
     else:
-        raise ValueError(f"Unsupported file type: {suffix}. Use .pdf or .ai files.")
+        text = extract_text_from_pdf(file_path)
 
     # Extract barcodes and append their data
     if include_barcodes:
@@ -353,7 +346,7 @@ def normalize_text(text: str) -> str:
         return ""
 
     # Collapse whitespace and normalize
-    normalized = re.sub(r"\s+", " ", text.lower().strip())
+    normalized = _WS_RE.sub(" ", text.lower().strip())
     return normalized
 
 
@@ -411,8 +404,15 @@ def scan_layout_directory(
         log_error(f"Not a directory: {layouts_dir}")
         return
 
-    pattern = f"*{extension}"
-    layout_files = sorted(layouts_dir.glob(pattern))
+    # One scandir pass with a plain suffix check (case-insensitive, so
+    # ".AI" files are picked up too) instead of glob's per-entry matching
+    suffix = extension.lower()
+    with os.scandir(layouts_dir) as entries:
+        layout_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(suffix) and entry.is_file()
+        )
 
     if not layout_files:
         log_warning(f"No {extension} files found in {layouts_dir}")
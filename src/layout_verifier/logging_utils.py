@@ -1,6 +1,13 @@
 # src/layout_verifier/logging_utils.py
 #
 # Colored logging helpers for the layout verifier.
+#
+# Each helper writes its line with a single sys.stdout.write (print would
+# issue separate writes for the message and the newline). sys.stdout is
+# looked up on every call, so the CLI's UTF-8 wrapper on Windows still applies,
+# and may be None (pythonw, windowed builds), in which case nothing is written.
+
+import sys
 
 RESET = "\033[0m"
 RED = "\033[91m"
@@ -10,26 +17,39 @@ CYAN = "\033[96m"
 MAGENTA = "\033[95m"
 BOLD = "\033[1m"
 
+_INFO_PREFIX = f"{GREEN}[INFO]{RESET} "
+_WARNING_PREFIX = f"{YELLOW}[WARNING]{RESET} "
+_ERROR_PREFIX = f"{RED}[ERROR]{RESET} "
+_GPU_PREFIX = f"{CYAN}[GPU]{RESET} "
+_MODEL_PREFIX = f"{MAGENTA}[MODEL]{RESET} "
+_LLM_PREFIX = f"{CYAN}[LLM]{RESET} "
+
+
+def _write_line(prefix: str, msg: str) -> None:
+    out = sys.stdout
+    if out is not None:
+        out.write(f"{prefix}{msg}\n")
+
 
 def log_info(msg: str) -> None:
-    print(f"{GREEN}[INFO]{RESET} {msg}")
+    _write_line(_INFO_PREFIX, msg)
 
 
 def log_warning(msg: str) -> None:
-    print(f"{YELLOW}[WARNING]{RESET} {msg}")
+    _write_line(_WARNING_PREFIX, msg)
 
 
 def log_error(msg: str) -> None:
-    print(f"{RED}[ERROR]{RESET} {msg}")
+    _write_line(_ERROR_PREFIX, msg)
 
 
 def log_gpu(msg: str) -> None:
-    print(f"{CYAN}[GPU]{RESET} {msg}")
+    _write_line(_GPU_PREFIX, msg)
 
 
 def log_model(msg: str) -> None:
-    print(f"{MAGENTA}[MODEL]{RESET} {msg}")
+    _write_line(_MODEL_PREFIX, msg)
 
 
 def log_llm(msg: str) -> None:
-    print(f"{CYAN}[LLM]{RESET} {msg}")
+    _write_line(_LLM_PREFIX, msg)
@@ -7,12 +7,74 @@
 # This works on Windows without external binaries like wkhtmltopdf.
 
 import os
-from markdown import markdown
-from xhtml2pdf import pisa
+from functools import lru_cache
 
 from .logging_utils import log_info, log_error
 
 
+# Simple styling to keep the PDF readable and professional. The markup
+# around the report body never changes, so it is built once at import.
+_HTML_PREFIX = """
+    <html>
+      <head>
+        <meta charset="utf-8" />
+        <style>
+          body {
+            font-family: DejaVu Sans, Arial, Helvetica, sans-serif;
+            font-size: 11pt;
+            line-height: 1.4;
+          }
+          h1, h2, h3, h4 {
+            font-weight: bold;
+            margin-top: 12px;
+            margin-bottom: 6px;
+          }
+          h1 {
+            font-size: 18pt;
+          }
+          h2 {
+            font-size: 14pt;
+          }
+          h3 {
+            font-size: 12pt;
+          }
+          p {
+            margin: 4px 0;
+          }
+          code, pre {
+            font-family: "DejaVu Sans Mono", Consolas, monospace;
+            font-size: 9pt;
+          }
+          pre {
+            background: #f5f5f5;
+            padding: 6px;
+            border-radius: 4px;
+            overflow-x: auto;
+          }
+          table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 6px 0;
+          }
+          th, td {
+            border: 1px solid #cccccc;
+            padding: 4px 6px;
+            font-size: 9pt;
+          }
+          th {
+            background: #eeeeee;
+          }
+        </style>
+      </head>
+      <body>
+        """
+
+_HTML_SUFFIX = """
+      </body>
+    </html>
+    """
+
+
 def _strip_wrapping_markdown_fence(markdown_text: str) -> str:
     """
     If the entire content is wrapped in a top-level fenced code block like:
@@ -36,79 +98,35 @@ def _strip_wrapping_markdown_fence(markdown_text: str) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def _get_markdown_converter():
+    """
+    Build the Markdown converter once; loading its extensions is the costly
+    part, so the instance is reused (and reset) for every conversion.
+    """
+    import markdown
+
+    return markdown.Markdown(extensions=["fenced_code", "tables"])
+
+
 def save_pdf_from_markdown(markdown_text: str, output_path: str) -> None:
     """
     Convert Markdown → HTML → PDF using xhtml2pdf.
 
     Raises RuntimeError if PDF generation fails.
     """
+    # Imported here so only PDF reports pay for loading xhtml2pdf
+    # (and reportlab behind it)
+    from xhtml2pdf import pisa
+
     # Remove outer ```markdown ... ``` (or ``` ... ```) if present
     cleaned_markdown = _strip_wrapping_markdown_fence(markdown_text)
 
     # Basic GitHub-style HTML from Markdown
-    body_html = markdown(
-        cleaned_markdown,
-        extensions=["fenced_code", "tables"]
-    )
+    converter = _get_markdown_converter()
+    body_html = converter.reset().convert(cleaned_markdown)
 
-    # Simple styling to keep the PDF readable and professional
-    full_html = f"""
-    <html>
-      <head>
-        <meta charset="utf-8" />
-        <style>
-          body {{
-            font-family: DejaVu Sans, Arial, Helvetica, sans-serif;
-            font-size: 11pt;
-            line-height: 1.4;
-          }}
-          h1, h2, h3, h4 {{
-            font-weight: bold;
-            margin-top: 12px;
-            margin-bottom: 6px;
-          }}
-          h1 {{
-            font-size: 18pt;
-          }}
-          h2 {{
-            font-size: 14pt;
-          }}
-          h3 {{
-            font-size: 12pt;
-          }}
-          p {{
-            margin: 4px 0;
-          }}
-          code, pre {{
-            font-family: "DejaVu Sans Mono", Consolas, monospace;
-            font-size: 9pt;
-          }}
-          pre {{
-            background: #f5f5f5;
-            padding: 6px;
-            border-radius: 4px;
-            overflow-x: auto;
-          }}
-          table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 6px 0;
-          }}
-          th, td {{
-            border: 1px solid #cccccc;
-            padding: 4px 6px;
-            font-size: 9pt;
-          }}
-          th {{
-            background: #eeeeee;
-          }}
-        </style>
-      </head>
-      <body>
-        {body_html}
-      </body>
-    </html>
-    """
+    full_html = _HTML_PREFIX + body_html + _HTML_SUFFIX
 
     directory = os.path.dirname(output_path)
     if directory:
@@ -7,6 +7,8 @@ Generates verification reports in multiple formats:
 - PDF (via markdown conversion)
 """
 
+import csv
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -35,119 +37,130 @@ def generate_report(summary: "VerificationSummary", output_format: str = "markdo
         return _generate_markdown_report(summary)
 
 
+# Per-product templates for the Markdown report
+_PRODUCT_HEADER_TEMPLATE = (
+    "### Item# {item}\n"
+    "**File:** {file}\n"
+    "**Match rate:** {rate:.1f}% ({matched}/{total})\n"
+    "\n"
+)
+_MISSING_ROW_TEMPLATE = "| {field} | {expected} |\n"
+_FOUND_ROW_TEMPLATE = "| {field} | {value} | {match_type} |\n"
+_COMPLETE_ROW_TEMPLATE = "| {item} | {file} | {fields} |\n"
+
+
 def _generate_markdown_report(summary: "VerificationSummary") -> str:
     """Generate a Markdown verification report."""
-    lines = []
+    out = io.StringIO()
+    write = out.write
 
     # Header
-    lines.append("# Product Layout Verification Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    write("# Product Layout Verification Report\n\n")
+    write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     # Summary section
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Total products in Excel:** {summary.total_products}")
-    lines.append(f"- **Layouts verified:** {summary.products_verified}")
-    lines.append(f"- **Fully verified (all fields found):** {summary.products_complete}")
-    lines.append(f"- **Partially verified (some fields missing):** {summary.products_partial}")
-    lines.append(f"- **Layouts without Excel match:** {summary.layouts_without_match}")
-    lines.append(f"- **Overall success rate:** {summary.overall_success_rate:.1f}%")
-    lines.append("")
+    write("## Summary\n\n")
+    write(f"- **Total products in Excel:** {summary.total_products}\n")
+    write(f"- **Layouts verified:** {summary.products_verified}\n")
+    write(f"- **Fully verified (all fields found):** {summary.products_complete}\n")
+    write(f"- **Partially verified (some fields missing):** {summary.products_partial}\n")
+    write(f"- **Layouts without Excel match:** {summary.layouts_without_match}\n")
+    write(f"- **Overall success rate:** {summary.overall_success_rate:.1f}%\n\n")
 
     # Unmatched layouts
     if summary.unmatched_layouts:
-        lines.append("## Layouts Without Excel Match")
-        lines.append("")
-        lines.append("The following layout files could not be matched to any product in Excel:")
-        lines.append("")
+        write("## Layouts Without Excel Match\n\n")
+        write("The following layout files could not be matched to any product in Excel:\n\n")
         for filename in summary.unmatched_layouts:
-            lines.append(f"- {filename}")
-        lines.append("")
+            write(f"- {filename}\n")
+        write("\n")
 
     # Products with missing fields
     products_with_issues = [r for r in summary.results if not r.is_complete]
     if products_with_issues:
-        lines.append("## Products With Missing Fields")
-        lines.append("")
+        write("## Products With Missing Fields\n\n")
 
         for result in products_with_issues:
-            lines.append(f"### Item# {result.item_number}")
-            lines.append(f"**File:** {result.layout_file}")
-            lines.append(f"**Match rate:** {result.success_rate:.1f}% ({result.matched_fields}/{result.total_fields})")
-            lines.append("")
+            write(_PRODUCT_HEADER_TEMPLATE.format(
+                item=result.item_number,
+                file=result.layout_file,
+                rate=result.success_rate,
+                matched=result.matched_fields,
+                total=result.total_fields,
+            ))
 
             # Show missing fields
             missing = [fr for fr in result.field_results if not fr.found]
             if missing:
-                lines.append("**Missing fields:**")
-                lines.append("")
-                lines.append("| Field | Expected Value |")
-                lines.append("|-------|----------------|")
+                write("**Missing fields:**\n\n")
+                write("| Field | Expected Value |\n")
+                write("|-------|----------------|\n")
                 for fr in missing:
                     # Escape pipe characters in values
                     expected = fr.expected_value.replace("|", "\\|")
-                    lines.append(f"| {fr.field_name} | {expected} |")
-                lines.append("")
+                    write(_MISSING_ROW_TEMPLATE.format(field=fr.field_name, expected=expected))
+                write("\n")
 
             # Show found fields
             found = [fr for fr in result.field_results if fr.found]
             if found:
-                lines.append("**Found fields:**")
-                lines.append("")
-                lines.append("| Field | Value | Match Type |")
-                lines.append("|-------|-------|------------|")
+                write("**Found fields:**\n\n")
+                write("| Field | Value | Match Type |\n")
+                write("|-------|-------|------------|\n")
                 for fr in found:
                     value = fr.expected_value.replace("|", "\\|")
-                    lines.append(f"| {fr.field_name} | {value} | {fr.match_type} |")
-                lines.append("")
+                    write(_FOUND_ROW_TEMPLATE.format(
+                        field=fr.field_name, value=value, match_type=fr.match_type
+                    ))
+                write("\n")
 
     # Fully verified products (brief list)
     complete_products = [r for r in summary.results if r.is_complete]
     if complete_products:
-        lines.append("## Fully Verified Products")
-        lines.append("")
-        lines.append("The following products have all fields verified:")
-        lines.append("")
-        lines.append("| Item# | Layout File | Fields |")
-        lines.append("|-------|-------------|--------|")
+        write("## Fully Verified Products\n\n")
+        write("The following products have all fields verified:\n\n")
+        write("| Item# | Layout File | Fields |\n")
+        write("|-------|-------------|--------|\n")
         for result in complete_products:
-            lines.append(f"| {result.item_number} | {result.layout_file} | {result.total_fields} |")
-        lines.append("")
+            write(_COMPLETE_ROW_TEMPLATE.format(
+                item=result.item_number, file=result.layout_file, fields=result.total_fields
+            ))
+        write("\n")
 
-    return "\n".join(lines)
+    # Every section ends with a blank line; like the previous line-joined
+    # output, the report has no newline after that last (empty) line
+    return out.getvalue()[:-1]
 
 
 def _generate_csv_report(summary: "VerificationSummary") -> str:
     """Generate a CSV verification report."""
-    lines = []
+    buffer = io.StringIO()
+    # "\n" line endings, as for the other text reports (save_report writes
+    # in text mode)
+    writer = csv.writer(buffer, lineterminator="\n")
 
     # Header
-    lines.append("Item#,Layout File,Total Fields,Matched,Missing,Success Rate,Status,Missing Fields")
+    writer.writerow([
+        "Item#", "Layout File", "Total Fields", "Matched", "Missing",
+        "Success Rate", "Status", "Missing Fields",
+    ])
 
+    # csv.writer quotes fields containing commas, quotes or newlines
     for result in summary.results:
-        missing_fields = [fr.field_name for fr in result.field_results if not fr.found]
-        missing_str = "; ".join(missing_fields) if missing_fields else ""
-
+        missing_str = "; ".join(fr.field_name for fr in result.field_results if not fr.found)
         status = "COMPLETE" if result.is_complete else "PARTIAL"
 
-        # Escape commas in filename and missing fields
-        layout_file = f'"{result.layout_file}"' if "," in result.layout_file else result.layout_file
-        missing_str = f'"{missing_str}"' if "," in missing_str or ";" in missing_str else missing_str
-
-        lines.append(
-            f"{result.item_number},{layout_file},{result.total_fields},"
-            f"{result.matched_fields},{result.missing_fields},{result.success_rate:.1f}%,"
-            f"{status},{missing_str}"
-        )
+        writer.writerow([
+            result.item_number, result.layout_file, result.total_fields,
+            result.matched_fields, result.missing_fields, f"{result.success_rate:.1f}%",
+            status, missing_str,
+        ])
 
     # Add unmatched layouts at the end
     for filename in summary.unmatched_layouts:
-        layout_file = f'"{filename}"' if "," in filename else filename
-        lines.append(f"N/A,{layout_file},0,0,0,0%,NO_MATCH,")
+        writer.writerow(["N/A", filename, 0, 0, 0, "0%", "NO_MATCH", ""])
 
-    return "\n".join(lines)
+    return buffer.getvalue()
 
 
 def save_report(content: str, output_path: str, output_format: str = "markdown"):
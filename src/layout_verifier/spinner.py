@@ -1,10 +1,14 @@
 # src/layout_verifier/spinner.py
 #
 # Simple CLI spinner using a background thread.
-# Used to show activity during verification.
+# Used to show activity during verification, as a context manager
+# (with Spinner(...):) or via start()/stop().
+# Disabled when stdout is missing or not a TTY (pipes, CI logs) or when
+# LAYOUT_VERIFIER_NO_SPINNER=1 is set.
 
+import os
+import sys
 import threading
-import time
 from typing import Optional
 
 from .logging_utils import CYAN, RESET
@@ -16,17 +20,33 @@ class Spinner:
         self.spinner_cycle = ["-", "\\", "|", "/"]
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        # Set by stop(); wakes the spin loop immediately instead of polling
+        self._stop_event = threading.Event()
+        # sys.stdout is None under pythonw / windowed builds
+        self.enabled = (
+            sys.stdout is not None
+            and sys.stdout.isatty()
+            and os.environ.get("LAYOUT_VERIFIER_NO_SPINNER") != "1"
+        )
+
+    def __enter__(self) -> "Spinner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
 
     def start(self) -> None:
-        if self.running:
+        if not self.enabled or self.running:
             return
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._spin, daemon=True)
         self.thread.start()
 
     def _spin(self) -> None:
         idx = 0
-        while self.running:
+        while not self._stop_event.is_set():
             symbol = self.spinner_cycle[idx]
             print(
                 f"\r{CYAN}[LLM]{RESET} {self.message} {symbol}",
@@ -34,11 +54,14 @@ class Spinner:
                 flush=True,
             )
             idx = (idx + 1) % len(self.spinner_cycle)
-            time.sleep(0.1)
+            self._stop_event.wait(0.1)
 
     def stop(self) -> None:
         if not self.running:
             return
         self.running = False
-        time.sleep(0.15)
+        self._stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=0.2)
+            self.thread = None
         print("\r", end="", flush=True)
@@ -7,7 +7,6 @@ various matching strategies (exact, normalized, fuzzy).
 
 from dataclasses import dataclass, field
 from typing import Optional
-import re
 
 
 @dataclass
@@ -56,19 +55,28 @@ def normalize_for_matching(text: str) -> str:
     if not text:
         return ""
 
-    # Lowercase and strip
-    result = text.lower().strip()
+    # Lowercase, then strip and collapse whitespace in one split/join pass
+    # (str.split() splits on the same characters as the regex \s)
+    return " ".join(text.lower().split())
 
-    # Collapse whitespace
-    result = re.sub(r"\s+", " ", result)
 
-    return result
+def compact_for_matching(text_normalized: str) -> str:
+    """
+    Strip the separators from normalized text, for matching numeric values
+    (like EAN) that may be printed with spaces or dashes.
+
+    Normalized text only contains single spaces as whitespace, so removing
+    spaces and dashes is enough.
+    """
+    return text_normalized.replace(" ", "").replace("-", "")
 
 
 def find_value_in_text(
     expected_value: str,
     layout_text: str,
     layout_text_normalized: Optional[str] = None,
+    expected_normalized: Optional[str] = None,
+    layout_text_compact: Optional[str] = None,
 ) -> tuple[bool, str, str]:
     """
     Check if an expected value exists in the layout text.
@@ -82,6 +90,11 @@ def find_value_in_text(
         expected_value: The value to find.
         layout_text: The raw layout text.
         layout_text_normalized: Pre-normalized layout text (optional, for efficiency).
+        expected_normalized: Pre-normalized expected value (optional, for efficiency
+                             when the same value is checked against many layouts).
+        layout_text_compact: compact_for_matching() of the normalized layout text
+                             (optional, for efficiency when several fields are
+                             checked against the same layout).
 
     Returns:
         Tuple of (found, match_type, matched_text).
@@ -96,7 +109,8 @@ def find_value_in_text(
         return True, "exact", expected_stripped
 
     # Strategy 2: Normalized match
-    expected_normalized = normalize_for_matching(expected_stripped)
+    if expected_normalized is None:
+        expected_normalized = normalize_for_matching(expected_stripped)
     if layout_text_normalized is None:
         layout_text_normalized = normalize_for_matching(layout_text)
 
@@ -113,10 +127,11 @@ def find_value_in_text(
 
     # Strategy 4: For numeric values (like EAN), try variations
     # Remove common separators and check
-    if expected_stripped.replace("-", "").replace(" ", "").isdigit():
-        clean_expected = expected_stripped.replace("-", "").replace(" ", "")
-        clean_layout = re.sub(r"[\s\-]", "", layout_text_normalized)
-        if clean_expected.lower() in clean_layout:
+    clean_expected = expected_stripped.replace("-", "").replace(" ", "")
+    if clean_expected.isdigit():
+        if layout_text_compact is None:
+            layout_text_compact = compact_for_matching(layout_text_normalized)
+        if clean_expected.lower() in layout_text_compact:
             return True, "normalized", clean_expected
 
     return False, "not_found", ""
@@ -127,6 +142,7 @@ def verify_product_fields(
     layout_file: str,
     expected_fields: dict[str, str],
     layout_text: str,
+    expected_normalized: Optional[dict[str, str]] = None,
 ) -> ProductVerificationResult:
     """
     Verify that all expected fields exist in the layout text.
@@ -136,6 +152,9 @@ def verify_product_fields(
         layout_file: Name of the layout file being verified.
         expected_fields: Dictionary of field_name -> expected_value.
         layout_text: The extracted text from the layout file.
+        expected_normalized: Dictionary of field_name -> normalized expected value
+                             (optional). Lets callers normalize a product's values
+                             once when it is checked against several layouts.
 
     Returns:
         ProductVerificationResult with details about each field's verification.
@@ -146,12 +165,16 @@ def verify_product_fields(
         total_fields=len(expected_fields),
     )
 
-    # Pre-normalize layout text for efficiency
+    # Pre-normalize layout text once for all fields
     layout_normalized = normalize_for_matching(layout_text)
+    layout_compact = compact_for_matching(layout_normalized)
+    if expected_normalized is None:
+        expected_normalized = {}
 
     for field_name, expected_value in expected_fields.items():
         found, match_type, matched_text = find_value_in_text(
-            expected_value, layout_text, layout_normalized
+            expected_value, layout_text, layout_normalized,
+            expected_normalized.get(field_name), layout_compact,
         )
 
         field_result = FieldResult(